@@ -0,0 +1,44 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor is the sort key of the last row on a page, as a base64url-encoded JSON array.
+Clients pass it back verbatim; it is never meant to be parsed on their side.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def _encode_value(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key (datetimes, UUIDs, strings) into an opaque cursor."""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable[[str], Any]]) -> Tuple[Any, ...]:
+    """Decode a cursor back into typed values. Raises HTTPException 400 if malformed."""
+    try:
+        parts = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(parts, list) or len(parts) != len(parsers):
+            raise ValueError("cursor arity mismatch")
+        # encode_cursor only emits strings; anything else is forged and parsers may not reject it cleanly
+        if not all(isinstance(part, str) for part in parts):
+            raise ValueError("cursor element is not a string")
+        return tuple(parse(part) for parse, part in zip(parsers, parts))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
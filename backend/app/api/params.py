@@ -0,0 +1,26 @@
+"""Shared query/header parameter declarations, reused across route modules."""
+
+from typing import Annotated, Optional
+
+from fastapi import Header, Query
+
+
+# Defaults stay at the call site: FastAPI rejects defaults inside Annotated Query()
+LimitQ = Annotated[int, Query(ge=1, le=200, description="Max results to return")]
+OffsetQ = Annotated[
+    int,
+    Query(ge=0, deprecated=True, description="Pagination offset (prefer cursor; ignored when cursor is set)")
+]
+IncludeDeletedQ = Annotated[bool, Query(description="Include soft-deleted records")]
+CursorQ = Annotated[
+    Optional[str],
+    Query(description="Opaque keyset cursor from a previous page's X-Next-Cursor header")
+]
+IncludeTotalQ = Annotated[
+    bool,
+    Query(description="Return the total matching count in X-Total-Count (offset pagination only; ignored with cursor)")
+]
+IfNoneMatchH = Annotated[
+    Optional[str],
+    Header(description="ETag(s) from a previous response; answered with 304 when unchanged")
+]
@@ -0,0 +1,212 @@
+"""Response helpers shared by route modules."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+import asyncio
+import calendar
+
+import orjson
+from fastapi import HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import get_settings
+from backend.app.core.database import AsyncSessionLocal
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Lists longer than this are encoded in a worker thread, off the event loop
+LIST_OFFLOAD_THRESHOLD = 32
+
+
+def to_read_model(read_model: Type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """Build a *Read DTO from an ORM row without re-validation (values are already typed by the DB).
+
+    `overrides` supply fields that can't be read straight off `obj` (e.g. nested DTO lists).
+    Falls back to full model_validate when STRICT_MODE is enabled.
+    """
+    strict = get_settings().STRICT_MODE
+    if strict and not overrides:
+        return read_model.model_validate(obj)
+    values = {
+        name: overrides[name] if name in overrides else getattr(obj, name)
+        for name in read_model.model_fields
+    }
+    return read_model.model_validate(values) if strict else read_model.model_construct(**values)
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serialize a single DTO straight to a JSON Response (no response_model re-validation)."""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+@lru_cache(maxsize=None)
+def _field_names(read_model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Field names of a *Read DTO, in declaration (= JSON key) order."""
+    return tuple(read_model.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(read_model: Type[BaseModel]) -> TypeAdapter:
+    """List TypeAdapter for a *Read DTO, built once per model (STRICT_MODE / orjson fallback path)."""
+    return TypeAdapter(List[read_model])
+
+
+def _dump_list(read_model: Type[BaseModel], rows: List[Any]) -> bytes:
+    """Encode ORM rows as a JSON array of `read_model` fields.
+
+    Rows are read field by field into dicts and encoded by orjson in one call (UUID, datetime and
+    JSONB dicts are native to it), skipping pydantic validation and serialization entirely.
+    STRICT_MODE validates through a list TypeAdapter instead.
+    """
+    if not get_settings().STRICT_MODE:
+        names = _field_names(read_model)
+        try:
+            return orjson.dumps(
+                [{name: getattr(row, name) for name in names} for row in rows],
+                option=orjson.OPT_UTC_Z
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects values it can't encode natively (e.g. ints beyond 64 bits in JSONB
+            # meta); pydantic can, so one odd row must not fail the whole page
+            pass
+    adapter = _list_adapter(read_model)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+async def list_response(
+    read_model: Type[BaseModel],
+    rows: List[Any],
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize ORM rows straight to a JSON array Response (no response_model re-validation).
+
+    Large lists are encoded via asyncio.to_thread so a 200-row page doesn't stall other
+    requests for the whole encode; small ones stay inline (thread hop costs more than it saves).
+    """
+    if len(rows) > LIST_OFFLOAD_THRESHOLD:
+        payload = await asyncio.to_thread(_dump_list, read_model, rows)
+    else:
+        payload = _dump_list(read_model, rows)
+    return Response(content=payload, status_code=status_code, media_type="application/json")
+
+
+async def stream_json_array(
+    batches: AsyncIterator[List[Any]],
+    read_model: Type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """Encode batches of ORM rows as one JSON array of `read_model`, a batch at a time (for StreamingResponse)."""
+    yield b"["
+    first = True
+    async for batch in batches:
+        if not batch:
+            continue
+        # Each batch serializes to "[...]"; strip the brackets and splice into the outer array
+        chunk = _dump_list(read_model, batch)[1:-1]
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
+async def stream_list_response(
+    open_batches: Callable[[AsyncSession], AsyncIterator[List[Any]]],
+    read_model: Type[BaseModel]
+) -> StreamingResponse:
+    """Stream `open_batches(db)` as one JSON array of `read_model` (unbounded listings).
+
+    get_db's session is closed before a streamed body is sent, so the stream owns its session.
+    The first batch is fetched before the response is built: once streaming starts the 200 is
+    already on the wire, so query errors must surface here to still map to a 5xx.
+    """
+    db = AsyncSessionLocal()
+    batches = open_batches(db)
+    try:
+        first = await batches.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await batches.aclose()
+        await db.close()
+        raise
+
+    async def rest() -> AsyncIterator[List[Any]]:
+        if first is not None:
+            yield first
+            async for batch in batches:
+                yield batch
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in stream_json_array(rest(), read_model):
+                yield chunk
+        finally:
+            await batches.aclose()
+            await db.close()
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+def make_etag(row_id: UUID, updated_at: datetime) -> str:
+    """Weak ETag for a row: W/"<id>-<updated_at epoch µs>". Changes whenever the row is updated.
+
+    Needs only (id, updated_at), so conditional GETs can be answered from a single-column lookup.
+    """
+    # timegm treats naive datetimes as UTC (how TimestampMixin stores them)
+    epoch_us = calendar.timegm(updated_at.utctimetuple()) * 1_000_000 + updated_at.microsecond
+    return f'W/"{row_id}-{epoch_us}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Validator headers for a cacheable single-row response: clients may cache but must revalidate."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 Not Modified for a matched If-None-Match (no body)."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+async def conditional_get(
+    if_none_match: Optional[str],
+    row_id: UUID,
+    get_updated_at: Callable[[], Awaitable[Optional[datetime]]],
+    not_found: str
+) -> Optional[Response]:
+    """Answer a conditional GET from updated_at alone, before the full row is fetched.
+
+    Returns a 304 when If-None-Match matches the row's ETag, None when the caller should fetch
+    and send the row. Raises 404 ("<not_found> <id> not found") if `get_updated_at()` finds no row.
+    """
+    if not if_none_match:
+        return None
+    updated_at = await get_updated_at()
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{not_found} {row_id} not found"
+        )
+    etag = make_etag(row_id, updated_at)
+    return not_modified_response(etag) if etag_matches(if_none_match, etag) else None
@@ -1,12 +1,12 @@
-"""Main API router aggregation."""
+"""Main API router aggregation (the only place route modules are mounted)."""
 
 from fastapi import APIRouter
 
 from backend.app.api.routes import events, health, spirits
+from backend.app.core.config import get_settings
 
-api_router = APIRouter()
+api_router = APIRouter(prefix=get_settings().API_PREFIX)
 
-# Include route modules
-api_router.include_router(health.router, tags=["health"])
-api_router.include_router(events.router, tags=["events"])
-api_router.include_router(spirits.router, tags=["spirits"])
+# Route modules declare their own prefix/tags; mount each exactly once
+for route_module in (health, events, spirits):
+    api_router.include_router(route_module.router)
@@ -1,12 +1,24 @@
 """Events API endpoints."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Annotated, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from backend.app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from backend.app.api.params import CursorQ, IfNoneMatchH, IncludeDeletedQ, LimitQ, OffsetQ
+from backend.app.api.responses import (
+    conditional_get,
+    etag_headers,
+    list_response,
+    make_etag,
+    model_response,
+    stream_list_response,
+    to_read_model,
+)
 from backend.app.core.database import get_db
 from backend.app.domain.event_operations import EventOperations
 from backend.app.models.database.events import EventCreate, EventRead, EventUpdate
@@ -15,20 +27,24 @@ from backend.app.models.database.events import EventCreate, EventRead, EventUpda
 router = APIRouter(prefix="/events", tags=["events"])
 
 
+SpiritIdQ = Annotated[UUID, Query(description="Spirit UUID to filter by")]
+
+
 @router.post(
     "/",
-    response_model=EventRead,
+    response_model=None,
+    responses={201: {"model": EventRead}},
     status_code=status.HTTP_201_CREATED,
     summary="Create event"
 )
 async def create_event(
     data: EventCreate,
     db: AsyncSession = Depends(get_db)
-) -> EventRead:
+) -> Response:
     """Create new event. Validates Spirit FK, auto-defaults occurred_at, generates dedupe_key if needed."""
     try:
         event = await EventOperations.create(db, data)
-        return EventRead.model_validate(event)
+        return model_response(to_read_model(EventRead, event), status_code=status.HTTP_201_CREATED)
     except HTTPException:
         raise
     except IntegrityError as e:
@@ -44,47 +60,83 @@ async def create_event(
         )
 
 
+@router.post(
+    "/batch",
+    response_model=None,
+    responses={201: {"model": List[EventRead]}},
+    status_code=status.HTTP_201_CREATED,
+    summary="Create events in bulk"
+)
+async def create_events_batch(
+    data: List[EventCreate] = Body(..., min_length=1, max_length=500),
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """Create up to 500 events in one INSERT. Events whose dedupe_key already exists are skipped, not returned."""
+    events = await EventOperations.create_many(db, data)
+    return await list_response(EventRead, events, status_code=status.HTTP_201_CREATED)
+
+
 @router.get(
     "/",
-    response_model=List[EventRead],
+    response_model=None,
+    responses={200: {"model": List[EventRead]}},
     summary="List events"
 )
 async def list_events(
-    spirit_id: UUID = Query(..., description="Spirit UUID to filter by"),
-    limit: int = Query(50, ge=1, le=200, description="Max results to return"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    spirit_id: SpiritIdQ,
+    limit: LimitQ = 50,
+    offset: OffsetQ = 0,
+    cursor: CursorQ = None,
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     session_id: Optional[str] = Query(None, description="Filter by session ID"),
     min_importance: Optional[float] = Query(None, ge=0.0, le=1.0, description="Min importance score"),
-    include_deleted: bool = Query(False, description="Include soft-deleted events"),
+    include_deleted: IncludeDeletedQ = False,
     db: AsyncSession = Depends(get_db)
-) -> List[EventRead]:
-    """List events with filters. If session_id provided, returns chronological order (ASC), otherwise recent-first (DESC)."""
+) -> Response:
+    """List events with filters. If session_id provided, streams the whole session in chronological order (ASC), otherwise recent-first (DESC).
+
+    Recent-first pages set X-Next-Cursor when more rows may follow; pass it back as `cursor`.
+    """
     if session_id:
-        # Session-specific: chronological order
-        events = await EventOperations.get_by_session(
-            db, spirit_id, session_id, include_deleted
-        )
-    else:
-        # General query: recent-first order
-        events = await EventOperations.get_recent(
-            db, spirit_id, limit, offset, event_type, session_id, min_importance, include_deleted
+        # Session-specific: unbounded, so stream it instead of materializing every row
+        return await stream_list_response(
+            lambda session: EventOperations.stream_by_session(session, spirit_id, session_id, include_deleted),
+            EventRead
         )
 
-    return [EventRead.model_validate(event) for event in events]
+    # General query: recent-first order, keyset-paginated when a cursor is given
+    after = decode_cursor(cursor, (datetime.fromisoformat, datetime.fromisoformat, UUID)) if cursor else None
+    events = await EventOperations.get_recent(
+        db, spirit_id, limit, 0 if after else offset, event_type, session_id, min_importance,
+        include_deleted, after
+    )
+
+    response = await list_response(EventRead, events)
+    if len(events) == limit:
+        last = events[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.occurred_at, last.created_at, last.id)
+    return response
 
 
 @router.get(
     "/{event_id}",
-    response_model=EventRead,
+    response_model=None,
+    responses={200: {"model": EventRead}},
     summary="Get event by ID"
 )
 async def get_event(
     event_id: UUID,
-    include_deleted: bool = Query(False, description="Include soft-deleted events"),
+    include_deleted: IncludeDeletedQ = False,
+    if_none_match: IfNoneMatchH = None,
     db: AsyncSession = Depends(get_db)
-) -> EventRead:
-    """Get specific event by UUID."""
+) -> Response:
+    """Get specific event by UUID. Sends a weak ETag; answers 304 when If-None-Match matches."""
+    not_modified = await conditional_get(
+        if_none_match, event_id, lambda: EventOperations.get_updated_at(db, event_id, include_deleted), "Event"
+    )
+    if not_modified:
+        return not_modified
+
     event = await EventOperations.get_by_id(db, event_id, include_deleted)
     if not event:
         raise HTTPException(
@@ -92,23 +144,25 @@ async def get_event(
             detail=f"Event {event_id} not found"
         )
 
-    return EventRead.model_validate(event)
+    etag = make_etag(event.id, event.updated_at)
+    return model_response(to_read_model(EventRead, event), headers=etag_headers(etag))
 
 
 @router.patch(
     "/{event_id}",
-    response_model=EventRead,
+    response_model=None,
+    responses={200: {"model": EventRead}},
     summary="Update event"
 )
 async def update_event(
     event_id: UUID,
     data: EventUpdate,
     db: AsyncSession = Depends(get_db)
-) -> EventRead:
+) -> Response:
     """Update event (partial). Can update meta_summary, importance_score, metadata, is_deleted."""
     try:
         event = await EventOperations.update(db, event_id, data)
-        return EventRead.model_validate(event)
+        return model_response(to_read_model(EventRead, event))
     except HTTPException:
         raise
 
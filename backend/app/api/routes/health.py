@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-router = APIRouter()
+from backend.app.core.database import pool_status
+
+router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
@@ -8,9 +10,10 @@ async def health_check():
     """
     Health check endpoint.
 
-    Returns the health status of the API.
+    Returns the health status of the API and database connection pool usage.
     """
     return {
         "status": "healthy",
-        "message": "API is running"
+        "message": "API is running",
+        "db_pool": pool_status()
     }
@@ -1,14 +1,29 @@
 """Spirits API endpoints."""
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.api.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, decode_cursor, encode_cursor
+from backend.app.api.params import CursorQ, IfNoneMatchH, IncludeDeletedQ, IncludeTotalQ, LimitQ, OffsetQ
+from backend.app.api.responses import (
+    conditional_get,
+    etag_headers,
+    list_response,
+    make_etag,
+    model_response,
+    stream_list_response,
+    to_read_model,
+)
 from backend.app.core.database import get_db
-from backend.app.domain.spirit_operations import SpiritOperations
+from backend.app.domain.spirit_operations import NameMatch, SpiritOperations
+from backend.app.models.database.events import EventRead
 from backend.app.models.database.spirits import SpiritCreate, SpiritRead, SpiritUpdate
+from backend.app.models.dto.spirits import SpiritWithEventsRead
 
 
 router = APIRouter(prefix="/spirits", tags=["spirits"])
@@ -16,123 +31,218 @@ router = APIRouter(prefix="/spirits", tags=["spirits"])
 
 @router.post(
     "/",
-    response_model=SpiritRead,
+    response_model=None,
+    responses={201: {"model": SpiritRead}},
     status_code=status.HTTP_201_CREATED,
     summary="Create spirit"
 )
 async def create_spirit(
     data: SpiritCreate,
     db: AsyncSession = Depends(get_db)
-) -> SpiritRead:
+) -> Response:
     """Create new spirit. Name required, description and meta optional."""
     spirit = await SpiritOperations.create(db, data)
-    return SpiritRead.model_validate(spirit)
+    return model_response(to_read_model(SpiritRead, spirit), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/batch",
+    response_model=None,
+    responses={201: {"model": List[SpiritRead]}},
+    status_code=status.HTTP_201_CREATED,
+    summary="Create spirits in bulk"
+)
+async def create_spirits_batch(
+    data: List[SpiritCreate] = Body(..., min_length=1, max_length=500),
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """Create up to 500 spirits in one batched INSERT. Returned in input order."""
+    spirits = await SpiritOperations.bulk_create(db, data)
+    return await list_response(SpiritRead, spirits, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/search",
-    response_model=List[SpiritRead],
+    response_model=None,
+    responses={200: {"model": List[SpiritRead]}},
     summary="Search spirits by name"
 )
 async def search_spirits(
     name: str = Query(..., description="Name query (partial match, case-insensitive)", min_length=1),
-    limit: int = Query(50, ge=1, le=200, description="Max results to return"),
+    limit: LimitQ = 50,
+    cursor: CursorQ = None,
+    match: NameMatch = Query(NameMatch.CONTAINS, description="contains (substring), prefix, or similar (typo-tolerant, ranked)"),
     db: AsyncSession = Depends(get_db)
-) -> List[SpiritRead]:
-    """Search spirits by name using partial matching (ILIKE). Ordered alphabetically."""
-    spirits = await SpiritOperations.search_by_name(db, name, limit)
-    return [SpiritRead.model_validate(spirit) for spirit in spirits]
+) -> Response:
+    """Search spirits by name: substring (ILIKE) or prefix, ordered alphabetically; or trigram similarity, best match first.
+
+    Alphabetical modes set X-Next-Cursor when more rows may follow; pass it back as `cursor`.
+    """
+    after = decode_cursor(cursor, (str, UUID)) if cursor else None
+    spirits = await SpiritOperations.search_by_name(db, name, limit, after, match)
+
+    response = await list_response(SpiritRead, spirits)
+    if len(spirits) == limit and match is not NameMatch.SIMILAR:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(spirits[-1].name, spirits[-1].id)
+    return response
 
 
 @router.get(
     "/",
-    response_model=List[SpiritRead],
+    response_model=None,
+    responses={200: {"model": List[SpiritRead]}},
     summary="List spirits"
 )
 async def list_spirits(
-    limit: int = Query(50, ge=1, le=200, description="Max results to return"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-    include_deleted: bool = Query(False, description="Include soft-deleted spirits"),
+    limit: LimitQ = 50,
+    offset: OffsetQ = 0,
+    cursor: CursorQ = None,
+    include_deleted: IncludeDeletedQ = False,
+    include_total: IncludeTotalQ = False,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """List all spirits, paginated, ordered DESC (newest first).
+
+    Sets X-Next-Cursor when more rows may follow; pass it back as `cursor`.
+    With include_total (offset pagination), X-Total-Count is fetched in the same query as the page.
+    """
+    after = decode_cursor(cursor, (datetime.fromisoformat, UUID)) if cursor else None
+    total = None
+    if include_total and after is None:
+        spirits, total = await SpiritOperations.get_page(db, limit, offset, include_deleted)
+    else:
+        spirits = await SpiritOperations.get_all(db, limit, 0 if after else offset, include_deleted, after)
+
+    response = await list_response(SpiritRead, spirits)
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if len(spirits) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(spirits[-1].created_at, spirits[-1].id)
+    return response
+
+
+@router.get(
+    "/stream",
+    response_model=None,
+    responses={200: {"model": List[SpiritRead]}},
+    summary="Stream all spirits"
+)
+async def stream_spirits(
+    include_deleted: IncludeDeletedQ = False
+) -> StreamingResponse:
+    """Stream every spirit, newest first, as one JSON array encoded batch by batch (no pagination)."""
+    return await stream_list_response(
+        lambda session: SpiritOperations.stream_all(session, include_deleted),
+        SpiritRead
+    )
+
+
+@router.get(
+    "/deleted",
+    response_model=None,
+    responses={200: {"model": List[SpiritRead]}},
+    summary="List recently deleted spirits"
+)
+async def list_deleted_spirits(
+    limit: LimitQ = 50,
+    since: Optional[datetime] = Query(None, description="Only spirits deleted at or after this time"),
     db: AsyncSession = Depends(get_db)
-) -> List[SpiritRead]:
-    """List all spirits, paginated, ordered DESC (newest first)."""
-    spirits = await SpiritOperations.get_all(db, limit, offset, include_deleted)
-    return [SpiritRead.model_validate(spirit) for spirit in spirits]
+) -> Response:
+    """List soft-deleted spirits, most recently deleted first (candidates for restore)."""
+    spirits = await SpiritOperations.get_recently_deleted(db, limit, since)
+    return await list_response(SpiritRead, spirits)
 
 
 @router.get(
     "/{spirit_id}/with-events",
-    response_model=SpiritRead,
+    response_model=None,
+    responses={200: {"model": SpiritWithEventsRead}},
     summary="Get spirit with events"
 )
 async def get_spirit_with_events(
     spirit_id: UUID,
-    include_deleted: bool = Query(False, description="Include soft-deleted spirits"),
+    events_limit: int = Query(50, ge=1, le=200, description="Max recent events to include"),
+    include_deleted: IncludeDeletedQ = False,
     db: AsyncSession = Depends(get_db)
-) -> SpiritRead:
-    """Get spirit with eager-loaded events relationship. Avoids N+1 queries."""
-    spirit = await SpiritOperations.get_with_events(db, spirit_id, include_deleted)
+) -> Response:
+    """Get spirit with its most recent events (newest first), fetched in a single query."""
+    spirit = await SpiritOperations.get_with_events(db, spirit_id, include_deleted, events_limit)
     if not spirit:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Spirit {spirit_id} not found"
         )
 
-    return SpiritRead.model_validate(spirit)
+    return model_response(to_read_model(
+        SpiritWithEventsRead,
+        spirit,
+        events=[to_read_model(EventRead, event) for event in spirit.events]
+    ))
 
 
 @router.get(
     "/{spirit_id}",
-    response_model=SpiritRead,
+    response_model=None,
+    responses={200: {"model": SpiritRead}},
     summary="Get spirit by ID"
 )
 async def get_spirit(
     spirit_id: UUID,
-    include_deleted: bool = Query(False, description="Include soft-deleted spirits"),
+    include_deleted: IncludeDeletedQ = False,
+    if_none_match: IfNoneMatchH = None,
     db: AsyncSession = Depends(get_db)
-) -> SpiritRead:
-    """Get specific spirit by UUID."""
-    spirit = await SpiritOperations.get_by_id(db, spirit_id, include_deleted)
-    if not spirit:
+) -> Response:
+    """Get specific spirit by UUID. Sends a weak ETag; answers 304 when If-None-Match matches."""
+    not_modified = await conditional_get(
+        if_none_match, spirit_id, lambda: SpiritOperations.get_updated_at(db, spirit_id, include_deleted), "Spirit"
+    )
+    if not_modified:
+        return not_modified
+
+    spirit = await SpiritOperations.get_by_id_core(db, spirit_id, include_deleted)
+    if spirit is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Spirit {spirit_id} not found"
         )
 
-    return SpiritRead.model_validate(spirit)
+    etag = make_etag(spirit.id, spirit.updated_at)
+    return model_response(to_read_model(SpiritRead, spirit), headers=etag_headers(etag))
 
 
 @router.patch(
     "/{spirit_id}",
-    response_model=SpiritRead,
+    response_model=None,
+    responses={200: {"model": SpiritRead}},
     summary="Update spirit"
 )
 async def update_spirit(
     spirit_id: UUID,
     data: SpiritUpdate,
     db: AsyncSession = Depends(get_db)
-) -> SpiritRead:
+) -> Response:
     """Update spirit (partial). Can update name, description, meta, is_deleted."""
     try:
         spirit = await SpiritOperations.update(db, spirit_id, data)
-        return SpiritRead.model_validate(spirit)
+        return model_response(to_read_model(SpiritRead, spirit))
     except HTTPException:
         raise
 
 
 @router.post(
     "/{spirit_id}/restore",
-    response_model=SpiritRead,
+    response_model=None,
+    responses={200: {"model": SpiritRead}},
     summary="Restore soft-deleted spirit"
 )
 async def restore_spirit(
     spirit_id: UUID,
     db: AsyncSession = Depends(get_db)
-) -> SpiritRead:
+) -> Response:
     """Restore soft-deleted spirit (undelete)."""
     try:
         spirit = await SpiritOperations.restore(db, spirit_id)
-        return SpiritRead.model_validate(spirit)
+        return model_response(to_read_model(SpiritRead, spirit))
     except HTTPException:
         raise
 
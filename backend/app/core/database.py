@@ -1,33 +1,116 @@
 """Async database engine and session management."""
 
-from typing import AsyncGenerator
+import asyncio
+import logging
+from typing import AsyncGenerator, Dict
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import sessionmaker
 
-from backend.app.core.config import settings
+from backend.app.core.config import get_settings
 
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+# pgBouncer transaction mode can't track server-side prepared statements; psycopg prepares
+# after 5 executions by default, which only bites once connections are reused. Set
+# DB_PREPARE_THRESHOLD only when connecting directly (or via a session-mode pooler).
+# prepare_threshold is psycopg-only: other drivers (e.g. asyncpg) reject it at connect time.
+_connect_args = (
+    {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+    if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg"
+    else {}
+)
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    poolclass=NullPool,  # Disable connection pooling (Supabase handles this)
+    pool_size=settings.DB_POOL_SIZE,  # Reuse connections: skip TCP/TLS + auth per request
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,  # Verify connections before using
+    # Compiled SQL is cached per statement shape (lambda_stmt keys included); sized for every hot path
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=_connect_args,
 )
 
+# Sync session factory behind AsyncSession (session events attach here, not on AsyncSession)
+_sync_session_factory = sessionmaker()
+
+
+@event.listens_for(_sync_session_factory, "after_flush")
+def _mark_flushed_writes(session, flush_context) -> None:
+    """Record that the unit of work sent INSERT/UPDATE/DELETEs in this transaction."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(_sync_session_factory, "do_orm_execute")
+def _mark_executed_writes(orm_execute_state) -> None:
+    """Record statement-level DML (insert()/update()/delete() run via session.execute)."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=_sync_session_factory,
     expire_on_commit=False,  # Don't expire objects after commit
     autoflush=False,  # Explicit flush control
     autocommit=False,  # Explicit commit control
 )
 
 
+async def warm_pool() -> None:
+    """Open DB_POOL_SIZE connections concurrently and return them to the pool.
+
+    Called at startup so the first requests after a deploy don't pay connection setup.
+    Failures are logged, not raised.
+    """
+    async def _open() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Warming is an optimisation: startup (and DB-free routes like /health) must not depend on it
+    results = await asyncio.gather(*(_open() for _ in range(settings.DB_POOL_SIZE)), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        logger.warning(
+            "Pool warm-up: %d of %d connections failed (first error: %r)",
+            len(failures), len(results), failures[0]
+        )
+
+
+async def estimate_row_count(session: AsyncSession, table_name: str) -> int:
+    """Approximate row count of a table from planner statistics (pg_class.reltuples). O(1).
+
+    Refreshed by (auto)vacuum/ANALYZE; 0 for a table that has never been analyzed.
+    """
+    result = await session.execute(
+        text("SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+        {"table": table_name}
+    )
+    return result.scalar_one()
+
+
+def pool_status() -> Dict[str, int]:
+    """Snapshot of connection pool usage (for health checks)."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool.overflow() counts up from -pool_size (unopened slots), so clamp to overflow in use
+        "overflow": max(0, pool.overflow()),
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting an async database session.
@@ -36,11 +119,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         @router.post("/events")
         async def create_event(db: AsyncSession = Depends(get_db)):
             ...
+
+    Commits only if the request wrote something; read-only transactions are simply
+    released on close (connection reset rolls them back). Raw text() DML is not
+    detected - set session.info["has_writes"] = True when issuing it.
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()  # Auto-commit on success
+            if session.info.get("has_writes") or session.new or session.dirty or session.deleted:
+                await session.commit()  # Auto-commit on success
         except Exception:
             await session.rollback()  # Auto-rollback on error
             raise
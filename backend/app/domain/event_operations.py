@@ -5,14 +5,20 @@ No transaction management - routes handle commits/rollbacks.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
+import asyncio
+import calendar
 import hashlib
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, false, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from fastapi import HTTPException
 
+from backend.app.core.database import estimate_row_count
+from backend.app.domain.spirit_operations import SpiritOperations
 from backend.app.models.database.events import Event, EventCreate, EventUpdate
 from backend.app.models.database.spirits import Spirit
 
@@ -30,8 +36,7 @@ class EventOperations:
         Raises HTTPException 404 (Spirit not found) or 400 (validation failure).
         """
         # Validate spirit exists
-        spirit = await session.get(Spirit, data.spirit_id)
-        if not spirit or spirit.is_deleted:
+        if not await SpiritOperations.exists(session, data.spirit_id):
             raise HTTPException(
                 status_code=404,
                 detail=f"Spirit {data.spirit_id} not found or deleted"
@@ -78,6 +83,43 @@ class EventOperations:
 
         return event
 
+    @staticmethod
+    async def create_many(
+        session: AsyncSession,
+        items: List[EventCreate]
+    ) -> List[Event]:
+        """Bulk create events: one Spirit FK check + one INSERT ... RETURNING, instead of 2 round trips per event.
+
+        Rows whose dedupe_key already exists are skipped (ON CONFLICT DO NOTHING), so the
+        result may be shorter than the input. Raises HTTPException 404 (Spirit not found).
+        """
+        if not items:
+            return []
+
+        # Validate all spirits exist in a single query
+        spirit_ids = {item.spirit_id for item in items}
+        result = await session.execute(
+            select(Spirit.id).where(Spirit.id.in_(spirit_ids), Spirit.deleted_at.is_(None))
+        )
+        missing = spirit_ids - set(result.scalars().all())
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Spirits not found or deleted: {', '.join(sorted(str(i) for i in missing))}"
+            )
+
+        # Dedupe-key hashing is CPU-bound; keep large batches off the event loop
+        rows = await asyncio.to_thread(EventOperations._build_insert_rows, items)
+
+        stmt = (
+            pg_insert(Event)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["dedupe_key"])
+            .returning(Event)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_by_id(
         session: AsyncSession,
@@ -85,7 +127,7 @@ class EventOperations:
         include_deleted: bool = False
     ) -> Optional[Event]:
         """Get event by ID. Returns None if not found or soft-deleted (unless include_deleted=True)."""
-        event = await session.get(Event, event_id)
+        event = await session.get(Event, event_id, options=[raiseload("*")])
 
         if event is None:
             return None
@@ -95,6 +137,21 @@ class EventOperations:
 
         return event
 
+    @staticmethod
+    async def get_updated_at(
+        session: AsyncSession,
+        event_id: UUID,
+        include_deleted: bool = False
+    ) -> Optional[datetime]:
+        """Get only an event's updated_at (ETag revalidation). None if not found or soft-deleted."""
+        query = select(Event.updated_at).where(Event.id == event_id)
+
+        if not include_deleted:
+            query = query.where(Event.is_deleted == false())
+
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_recent(
         session: AsyncSession,
@@ -104,14 +161,21 @@ class EventOperations:
         event_type: Optional[str] = None,
         session_id: Optional[str] = None,
         min_importance: Optional[float] = None,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[Tuple[datetime, datetime, UUID]] = None
     ) -> List[Event]:
-        """Get recent events for spirit with filters. Ordered DESC (newest first), paginated."""
-        query = select(Event).where(Event.spirit_id == spirit_id)
+        """Get recent events for spirit with filters. Ordered DESC (newest first), paginated.
+
+        Pass `after` = (occurred_at, created_at, id) of the previous page's last event for keyset
+        pagination: O(limit) via ix_events_spirit_active, unlike OFFSET which re-reads every skipped
+        row. Events with NULL occurred_at (not produced by create) are not reachable by keyset.
+        """
+        # raiseload: any accidental relationship access fails loudly instead of issuing N+1 queries
+        query = select(Event).options(raiseload("*")).where(Event.spirit_id == spirit_id)
 
         # Apply filters
         if not include_deleted:
-            query = query.where(Event.is_deleted.is_(False))
+            query = query.where(Event.is_deleted == false())
 
         if event_type:
             query = query.where(Event.event_type == event_type)
@@ -122,10 +186,16 @@ class EventOperations:
         if min_importance is not None:
             query = query.where(Event.importance_score >= min_importance)
 
-        # Order by occurred_at (most recent first), with created_at as tiebreaker
+        if after is not None:
+            # Keyset: strictly past the previous page's last row
+            query = query.where(
+                tuple_(Event.occurred_at, Event.created_at, Event.id) < tuple_(*after)
+            )
+
+        # Order by occurred_at (most recent first), created_at then id as tiebreakers (stable keyset)
         query = (
             query
-            .order_by(Event.occurred_at.desc(), Event.created_at.desc())
+            .order_by(Event.occurred_at.desc(), Event.created_at.desc(), Event.id.desc())
             .limit(limit)
             .offset(offset)
         )
@@ -141,20 +211,48 @@ class EventOperations:
         include_deleted: bool = False
     ) -> List[Event]:
         """Get all events in session. Ordered ASC (chronological - oldest first)."""
+        result = await session.execute(
+            EventOperations._session_query(spirit_id, session_id, include_deleted)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def stream_by_session(
+        session: AsyncSession,
+        spirit_id: UUID,
+        session_id: str,
+        include_deleted: bool = False,
+        batch_size: int = 200
+    ) -> AsyncIterator[List[Event]]:
+        """Stream events in session (ASC) in batches via a server-side cursor. Memory stays O(batch_size)."""
+        result = await session.stream_scalars(
+            EventOperations._session_query(spirit_id, session_id, include_deleted)
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    def _session_query(
+        spirit_id: UUID,
+        session_id: str,
+        include_deleted: bool
+    ):
+        """Build the chronological (ASC) query for all events in a session."""
         conditions = [
             Event.spirit_id == spirit_id,
             Event.session_id == session_id
         ]
 
         if not include_deleted:
-            conditions.append(Event.is_deleted.is_(False))
+            conditions.append(Event.is_deleted == false())
 
-        result = await session.execute(
+        return (
             select(Event)
+            .options(raiseload("*"))
             .where(and_(*conditions))
             .order_by(Event.occurred_at.asc(), Event.created_at.asc())
         )
-        return list(result.scalars().all())
 
     @staticmethod
     async def count_by_spirit(
@@ -164,11 +262,15 @@ class EventOperations:
         session_id: Optional[str] = None,
         include_deleted: bool = False
     ) -> int:
-        """Count events for spirit with optional filters."""
+        """Count events for spirit with optional filters. Exact count.
+
+        Live-event counts are served by ix_events_spirit_active (index-only scan;
+        event_type/session_id are INCLUDEd columns).
+        """
         query = select(func.count()).select_from(Event).where(Event.spirit_id == spirit_id)
 
         if not include_deleted:
-            query = query.where(Event.is_deleted.is_(False))
+            query = query.where(Event.is_deleted == false())
 
         if event_type:
             query = query.where(Event.event_type == event_type)
@@ -179,23 +281,24 @@ class EventOperations:
         result = await session.execute(query)
         return result.scalar_one()
 
+    @staticmethod
+    async def count_estimated(session: AsyncSession) -> int:
+        """Approximate total event count from planner statistics (pg_class.reltuples). O(1), unfiltered.
+
+        Use count_by_spirit when an exact or filtered count is needed.
+        """
+        return await estimate_row_count(session, Event.__tablename__)
+
     @staticmethod
     async def update(
         session: AsyncSession,
         event_id: UUID,
         data: EventUpdate
     ) -> Event:
-        """Update event (partial). Validates importance_score range.
+        """Update event (partial) in a single UPDATE ... RETURNING. Validates importance_score range.
 
         Raises HTTPException 404 (not found) or 400 (validation failure).
         """
-        event = await session.get(Event, event_id)
-        if not event:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Event {event_id} not found"
-            )
-
         # Validate importance_score if being updated
         if data.importance_score is not None:
             if not (0.0 <= data.importance_score <= 1.0):
@@ -204,13 +307,25 @@ class EventOperations:
                     detail="importance_score must be between 0.0 and 1.0"
                 )
 
-        # Update only provided fields
-        update_dict = data.model_dump(exclude_unset=True)
-        for key, value in update_dict.items():
-            setattr(event, key, value)
+        # Update only provided fields (read straight off the model: no model_dump serialization pass)
+        update_dict = {name: getattr(data, name) for name in data.model_fields_set}
+        if not update_dict:
+            event = await EventOperations.get_by_id(session, event_id, include_deleted=True)
+        else:
+            result = await session.execute(
+                update(Event)
+                .where(Event.id == event_id)
+                .values(**update_dict)
+                .returning(Event)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            event = result.scalar_one_or_none()
 
-        session.add(event)
-        await session.flush()
+        if not event:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Event {event_id} not found"
+            )
         return event
 
     @staticmethod
@@ -243,13 +358,22 @@ class EventOperations:
     async def soft_delete(
         session: AsyncSession,
         event_id: UUID
-    ) -> Event:
-        """Soft delete event (mark as deleted, preserve for provenance)."""
-        return await EventOperations.update(
-            session,
-            event_id,
-            EventUpdate(is_deleted=True)
+    ) -> None:
+        """Soft delete event (mark as deleted, preserve for provenance). Single UPDATE, no row fetch.
+
+        Raises HTTPException 404 (not found).
+        """
+        result = await session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(is_deleted=True)
+            .returning(Event.id)
         )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Event {event_id} not found"
+            )
 
     @staticmethod
     async def restore(
@@ -263,6 +387,39 @@ class EventOperations:
             EventUpdate(is_deleted=False)
         )
 
+    @staticmethod
+    def _build_insert_rows(items: List[EventCreate]) -> List[dict]:
+        """Build INSERT parameter dicts for create_many (defaults occurred_at, generates dedupe_keys)."""
+        now = datetime.now(timezone.utc)
+        rows = []
+        for item in items:
+            occurred_at = item.occurred_at if item.occurred_at else now
+
+            dedupe_key = item.dedupe_key
+            if item.source_uri and not dedupe_key:
+                dedupe_key = EventOperations._generate_dedupe_key(
+                    spirit_id=item.spirit_id,
+                    event_type=item.event_type,
+                    content=item.content,
+                    occurred_at=occurred_at,
+                    source_uri=item.source_uri
+                )
+
+            rows.append({
+                "spirit_id": item.spirit_id,
+                "event_type": item.event_type,
+                "content": item.content,
+                "meta_summary": item.meta_summary,
+                "occurred_at": occurred_at,
+                "session_id": item.session_id,
+                "meta": item.meta or {},
+                "source_uri": item.source_uri,
+                "dedupe_key": dedupe_key,
+                "importance_score": item.importance_score
+            })
+
+        return rows
+
     @staticmethod
     def _generate_dedupe_key(
         spirit_id: UUID,
@@ -271,13 +428,16 @@ class EventOperations:
         occurred_at: datetime,
         source_uri: str
     ) -> str:
-        """Generate dedupe key: SHA256 hash (first 100 chars of content) truncated to 32 chars."""
-        parts = [
-            str(spirit_id),
-            event_type,
-            content[:100],  # First 100 chars only
-            occurred_at.isoformat(),
-            source_uri
-        ]
-        hash_input = "|".join(parts).encode()
-        return hashlib.sha256(hash_input).hexdigest()[:32]
+        """Generate dedupe key: 128-bit BLAKE2b hash (first 100 chars of content) as 32 hex chars.
+
+        Hashes raw bytes (16-byte UUID, 8-byte epoch microseconds) rather than their string forms.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(spirit_id.bytes)
+        # Naive datetimes are treated as UTC (matches how timestamps are stored)
+        epoch_us = calendar.timegm(occurred_at.utctimetuple()) * 1_000_000 + occurred_at.microsecond
+        h.update(epoch_us.to_bytes(8, "big", signed=True))
+        for part in (event_type, content[:100], source_uri):  # First 100 chars of content only
+            h.update(part.encode())
+            h.update(b"\x00")  # Field separator; NUL can't occur in Postgres text
+        return h.hexdigest()
@@ -4,17 +4,29 @@ CRUD operations and business logic for Spirits.
 No transaction management - routes handle commits/rollbacks.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import Row, exists, insert, lambda_stmt, false, literal, select, update, func, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException
 
+from backend.app.core.database import estimate_row_count
+from backend.app.models.database.events import Event
 from backend.app.models.database.spirits import Spirit, SpiritCreate, SpiritUpdate
 
 
+class NameMatch(str, Enum):
+    """Name matching strategies for search_by_name."""
+    CONTAINS = "contains"  # Substring (ILIKE '%q%')
+    PREFIX = "prefix"      # Starts with (LIKE 'q%')
+    SIMILAR = "similar"    # Trigram similarity (pg_trgm), ranked
+
+
 class SpiritOperations:
     """Spirit business logic. Static methods, async session-based, no commits."""
 
@@ -36,6 +48,28 @@ class SpiritOperations:
 
         return spirit
 
+    @staticmethod
+    async def bulk_create(
+        session: AsyncSession,
+        items: List[SpiritCreate]
+    ) -> List[Spirit]:
+        """Bulk create spirits in one batched INSERT ... RETURNING, instead of a flush per spirit.
+
+        Returned spirits are in input order.
+        """
+        if not items:
+            return []
+
+        rows = [
+            {"name": item.name, "description": item.description, "meta": item.meta or {}}
+            for item in items
+        ]
+        result = await session.execute(
+            insert(Spirit).returning(Spirit, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_by_id(
         session: AsyncSession,
@@ -43,40 +77,176 @@ class SpiritOperations:
         include_deleted: bool = False
     ) -> Optional[Spirit]:
         """Get spirit by ID. Returns None if not found or soft-deleted (unless include_deleted=True)."""
-        spirit = await session.get(Spirit, spirit_id)
+        spirit = await session.get(Spirit, spirit_id, options=[raiseload("*")])
 
         if spirit is None:
             return None
 
-        if not include_deleted and spirit.is_deleted:
+        if not include_deleted and spirit.deleted_at is not None:
             return None
 
         return spirit
 
+    @staticmethod
+    async def exists(
+        session: AsyncSession,
+        spirit_id: UUID,
+        include_deleted: bool = False
+    ) -> bool:
+        """Check a spirit exists (and is live unless include_deleted=True) without loading it."""
+        query = select(literal(1)).select_from(Spirit).where(Spirit.id == spirit_id)
+
+        if not include_deleted:
+            query = query.where(Spirit.deleted_at.is_(None))
+
+        return await session.scalar(query.limit(1)) is not None
+
+    @staticmethod
+    async def has_events(
+        session: AsyncSession,
+        spirit_id: UUID
+    ) -> bool:
+        """Check whether a spirit has any live events. EXISTS stops at the first match (no count)."""
+        query = select(
+            exists().where(Event.spirit_id == spirit_id, Event.is_deleted == false())
+        )
+        return await session.scalar(query)
+
+    @staticmethod
+    async def get_by_id_core(
+        session: AsyncSession,
+        spirit_id: UUID,
+        include_deleted: bool = False
+    ) -> Optional[Row]:
+        """Read-only get by ID as a plain Core row (attribute access like the ORM object).
+
+        Skips ORM instance construction and identity-map bookkeeping; use for handlers that only
+        serialize the result. Write paths keep using get_by_id/update.
+        """
+        # lambda_stmt: the statement is built and compiled once, then reused from the SQL cache
+        stmt = lambda_stmt(lambda: select(Spirit.__table__).where(Spirit.__table__.c.id == spirit_id))
+
+        if not include_deleted:
+            stmt += lambda s: s.where(Spirit.__table__.c.deleted_at.is_(None))
+
+        result = await session.execute(stmt)
+        return result.one_or_none()
+
+    @staticmethod
+    async def get_updated_at(
+        session: AsyncSession,
+        spirit_id: UUID,
+        include_deleted: bool = False
+    ) -> Optional[datetime]:
+        """Get only a spirit's updated_at (ETag revalidation). None if not found or soft-deleted."""
+        stmt = lambda_stmt(lambda: select(Spirit.updated_at).where(Spirit.id == spirit_id))
+
+        if not include_deleted:
+            stmt += lambda s: s.where(Spirit.deleted_at.is_(None))
+
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_all(
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Spirit]:
-        """Get all spirits (paginated). Ordered DESC (newest first)."""
-        query = select(Spirit)
+        """Get all spirits (paginated). Ordered DESC (newest first).
+
+        Pass `after` = (created_at, id) of the previous page's last spirit for keyset pagination:
+        an index range seek on ix_spirits_created_id instead of scanning past `offset` rows.
+        """
+        # raiseload: any accidental relationship access fails loudly instead of issuing N+1 queries
+        stmt = lambda_stmt(lambda: select(Spirit).options(raiseload("*")))
 
         # Filter out soft-deleted
         if not include_deleted:
-            query = query.where(Spirit.is_deleted.is_(False))
+            stmt += lambda s: s.where(Spirit.deleted_at.is_(None))
+
+        if after is not None:
+            # Keyset: strictly past the previous page's last row
+            after_created_at, after_id = after
+            stmt += lambda s: s.where(tuple_(Spirit.created_at, Spirit.id) < tuple_(after_created_at, after_id))
+
+        # Order by created_at (newest first), id as tiebreaker (stable keyset)
+        stmt += lambda s: s.order_by(Spirit.created_at.desc(), Spirit.id.desc()).limit(limit).offset(offset)
+
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def stream_all(
+        session: AsyncSession,
+        include_deleted: bool = False,
+        batch_size: int = 200
+    ) -> AsyncIterator[List[Spirit]]:
+        """Stream all spirits (newest first) in batches via a server-side cursor. Memory stays O(batch_size)."""
+        query = select(Spirit).options(raiseload("*"))
+
+        if not include_deleted:
+            query = query.where(Spirit.deleted_at.is_(None))
+
+        result = await session.stream_scalars(
+            query
+            .order_by(Spirit.created_at.desc(), Spirit.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    async def get_recently_deleted(
+        session: AsyncSession,
+        limit: int = 50,
+        since: Optional[datetime] = None
+    ) -> List[Spirit]:
+        """Get soft-deleted spirits, most recently deleted first (range scan on ix_spirits_deleted)."""
+        query = select(Spirit).options(raiseload("*")).where(Spirit.deleted_at.is_not(None))
+
+        if since is not None:
+            query = query.where(Spirit.deleted_at >= since)
+
+        query = query.order_by(Spirit.deleted_at.desc()).limit(limit)
+
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_page(
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0,
+        include_deleted: bool = False
+    ) -> Tuple[List[Spirit], int]:
+        """Get an offset page of spirits plus the total matching count, in one round trip.
+
+        COUNT(*) OVER () is evaluated over the filtered set before LIMIT/OFFSET, so the page and
+        its total share a single scan. Returns (spirits, total). Keyset (cursor) paths should use
+        get_all instead: infinite scroll has no use for a total.
+        """
+        query = select(Spirit, func.count().over().label("total")).options(raiseload("*"))
+
+        if not include_deleted:
+            query = query.where(Spirit.deleted_at.is_(None))
 
-        # Order by created_at (newest first)
         query = (
             query
-            .order_by(Spirit.created_at.desc())
+            .order_by(Spirit.created_at.desc(), Spirit.id.desc())
             .limit(limit)
             .offset(offset)
         )
 
         result = await session.execute(query)
-        return list(result.scalars().all())
+        rows = result.all()
+        if not rows:
+            # Offset past the end: no row carries the window total, count separately
+            return [], await SpiritOperations.count_all(session, include_deleted, exact=True)
+
+        return [row.Spirit for row in rows], rows[0].total
 
     @staticmethod
     async def update(
@@ -84,22 +254,59 @@ class SpiritOperations:
         spirit_id: UUID,
         data: SpiritUpdate
     ) -> Spirit:
-        """Update spirit (partial). Raises HTTPException 404 (not found)."""
-        spirit = await session.get(Spirit, spirit_id)
+        """Update spirit (partial) in a single UPDATE ... RETURNING. Raises HTTPException 404 (not found)."""
+        update_dict = SpiritOperations._update_values(data)
+        if not update_dict:
+            spirit = await SpiritOperations.get_by_id(session, spirit_id, include_deleted=True)
+        else:
+            result = await session.execute(
+                update(Spirit)
+                .where(Spirit.id == spirit_id)
+                .values(**update_dict)
+                .returning(Spirit)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            spirit = result.scalar_one_or_none()
+
         if not spirit:
             raise HTTPException(
                 status_code=404,
                 detail=f"Spirit {spirit_id} not found"
             )
+        return spirit
 
-        # Update only provided fields
-        update_dict = data.model_dump(exclude_unset=True)
-        for key, value in update_dict.items():
-            setattr(spirit, key, value)
+    @staticmethod
+    async def bulk_update(
+        session: AsyncSession,
+        spirit_ids: List[UUID],
+        data: SpiritUpdate
+    ) -> List[Spirit]:
+        """Apply the same partial update to many spirits in one UPDATE ... WHERE id IN ... RETURNING.
 
-        session.add(spirit)
-        await session.flush()
-        return spirit
+        Returns the updated spirits; ids that don't exist are skipped (no 404).
+        """
+        update_dict = SpiritOperations._update_values(data)
+        if not spirit_ids or not update_dict:
+            return []
+
+        result = await session.execute(
+            update(Spirit)
+            .where(Spirit.id.in_(spirit_ids))
+            .values(**update_dict)
+            .returning(Spirit)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _update_values(data: SpiritUpdate) -> dict:
+        """UPDATE values from the fields set on `data`; is_deleted maps onto deleted_at."""
+        # Update only provided fields
+        values = {name: getattr(data, name) for name in data.model_fields_set if name != "is_deleted"}
+        if data.is_deleted is not None:
+            # Re-deleting keeps the original deletion time
+            values["deleted_at"] = func.coalesce(Spirit.deleted_at, func.now()) if data.is_deleted else None
+        return values
 
     @staticmethod
     async def soft_delete(
@@ -125,52 +332,134 @@ class SpiritOperations:
             SpiritUpdate(is_deleted=False)
         )
 
+    @staticmethod
+    async def bulk_soft_delete(
+        session: AsyncSession,
+        spirit_ids: List[UUID]
+    ) -> List[Spirit]:
+        """Soft delete many spirits in one statement. Returns the spirits that were found."""
+        return await SpiritOperations.bulk_update(session, spirit_ids, SpiritUpdate(is_deleted=True))
+
+    @staticmethod
+    async def bulk_restore(
+        session: AsyncSession,
+        spirit_ids: List[UUID]
+    ) -> List[Spirit]:
+        """Restore many soft-deleted spirits in one statement. Returns the spirits that were found."""
+        return await SpiritOperations.bulk_update(session, spirit_ids, SpiritUpdate(is_deleted=False))
+
     @staticmethod
     async def search_by_name(
         session: AsyncSession,
         name_query: str,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[str, UUID]] = None,
+        match: NameMatch = NameMatch.CONTAINS
     ) -> List[Spirit]:
-        """Search spirits by name (partial match, case-insensitive). Excludes soft-deleted."""
-        query = select(Spirit).where(
-            and_(
-                Spirit.name.ilike(f"%{name_query}%"),
-                Spirit.is_deleted.is_(False)
+        """Search spirits by name (case-insensitive). Excludes soft-deleted.
+
+        CONTAINS: infix ILIKE, served by the ix_spirits_name_trgm GIN index. Ordered by name.
+        PREFIX: lower(name) LIKE 'q%', a btree range scan on ix_spirits_name_lower_prefix. Ordered by name.
+        SIMILAR: pg_trgm `%` match (typo-tolerant, same GIN index), ranked by similarity(); queries
+        shorter than 3 chars have too few trigrams and fall back to ILIKE. `after` is ignored.
+
+        Pass `after` = (name, id) of the previous page's last spirit for keyset pagination.
+        """
+        # Values are computed outside the lambdas; lambdas only reference them (bound as parameters)
+        if match is NameMatch.PREFIX:
+            # Escape LIKE wildcards (backslash is Postgres' default LIKE escape) so the query matches literally
+            escaped = name_query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"{escaped}%"
+            stmt = lambda_stmt(lambda: select(Spirit).where(func.lower(Spirit.name).like(pattern)))
+        elif match is NameMatch.SIMILAR and len(name_query) >= 3:
+            stmt = lambda_stmt(lambda: select(Spirit).where(Spirit.name.op("%")(name_query)))
+        else:
+            pattern = f"%{name_query}%"
+            stmt = lambda_stmt(lambda: select(Spirit).where(Spirit.name.ilike(pattern)))
+
+        stmt += lambda s: s.options(raiseload("*")).where(Spirit.deleted_at.is_(None))
+
+        if match is NameMatch.SIMILAR:
+            stmt += lambda s: s.order_by(
+                func.similarity(Spirit.name, name_query).desc(), Spirit.name.asc(), Spirit.id.asc()
             )
-        ).order_by(Spirit.name.asc()).limit(limit)
+        else:
+            if after is not None:
+                after_name, after_id = after
+                stmt += lambda s: s.where(tuple_(Spirit.name, Spirit.id) > tuple_(after_name, after_id))
+            stmt += lambda s: s.order_by(Spirit.name.asc(), Spirit.id.asc())
 
-        result = await session.execute(query)
+        stmt += lambda s: s.limit(limit)
+
+        result = await session.execute(stmt)
         return list(result.scalars().all())
 
     @staticmethod
     async def count_all(
         session: AsyncSession,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        exact: bool = False
     ) -> int:
-        """Count total spirits. Useful for pagination metadata."""
-        query = select(func.count()).select_from(Spirit)
+        """Count total spirits. Useful for pagination metadata.
+
+        Live-spirit counts are exact (index-only scan on the ix_spirits_created_id partial index).
+        With include_deleted, the whole-table count comes from count_all_estimate unless exact=True.
+        """
+        if include_deleted and not exact:
+            return await SpiritOperations.count_all_estimate(session)
+
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(Spirit))
 
         if not include_deleted:
-            query = query.where(Spirit.is_deleted.is_(False))
+            stmt += lambda s: s.where(Spirit.deleted_at.is_(None))
 
-        result = await session.execute(query)
+        result = await session.execute(stmt)
         return result.scalar_one()
 
+    @staticmethod
+    async def count_all_estimate(session: AsyncSession) -> int:
+        """Approximate total spirit count (including soft-deleted) from planner statistics. O(1)."""
+        return await estimate_row_count(session, Spirit.__tablename__)
+
     @staticmethod
     async def get_with_events(
         session: AsyncSession,
         spirit_id: UUID,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        events_limit: int = 50
     ) -> Optional[Spirit]:
-        """Get spirit with eager-loaded events relationship. Avoids N+1 query problem."""
+        """Get spirit with its most recent `events_limit` (non-deleted) events, newest first.
+
+        One query: a LATERAL subquery picks the latest events via ix_events_spirit_active, so the
+        result stays bounded however many events the spirit has. `spirit.events` is populated
+        directly, without a lazy load.
+        """
+        latest = (
+            select(Event)
+            .where(Event.spirit_id == Spirit.id, Event.is_deleted == false())
+            .order_by(Event.occurred_at.desc(), Event.created_at.desc(), Event.id.desc())
+            .limit(events_limit)
+            .lateral("latest_events")
+        )
+        latest_event = aliased(Event, latest)
+
         query = (
-            select(Spirit)
+            select(Spirit, latest_event)
+            .outerjoin(latest_event, true())
             .where(Spirit.id == spirit_id)
-            .options(selectinload(Spirit.events))
+            .options(raiseload("*"))
+            .order_by(latest_event.occurred_at.desc(), latest_event.created_at.desc(), latest_event.id.desc())
         )
 
         if not include_deleted:
-            query = query.where(Spirit.is_deleted.is_(False))
+            query = query.where(Spirit.deleted_at.is_(None))
 
         result = await session.execute(query)
-        return result.scalar_one_or_none()
+        rows = result.all()
+        if not rows:
+            return None
+
+        spirit = rows[0][0]
+        # Outer join: a spirit without events yields a single (spirit, None) row
+        set_committed_value(spirit, "events", [event for _, event in rows if event is not None])
+        return spirit
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel, Relationship
 
@@ -30,7 +30,7 @@ class EventBase(SQLModel):
     session_id: str | None = Field(default=None, max_length=255, index=True, nullable=True)
     meta: dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False))
     source_uri: str | None = Field(default=None, nullable=True)
-    dedupe_key: str | None = Field(default=None, max_length=255, nullable=True)
+    dedupe_key: str | None = Field(default=None, max_length=255, unique=True, index=True, nullable=True)
     importance_score: float | None = Field(default=None, ge=0.0, le=1.0, nullable=True)
 
 
@@ -42,7 +42,32 @@ class Event(EventBase, TimestampMixin, table=True):
     is_deleted: bool = Field(default=False)
 
     # Relationship to Spirit
-    spirit: Spirit = Relationship(back_populates="events")
+    spirit: Spirit = Relationship(back_populates="events", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+
+# Covering partial index for per-spirit reads/counts of live events (index-only scans).
+# Key order matches get_recent's ORDER BY so keyset pages are a single range scan.
+# Queries must filter with `is_deleted == false()` (renders `= false`): the planner
+# won't prove `IS false` implies this predicate, so `.is_(False)` skips the index.
+Index(
+    "ix_events_spirit_active",
+    Event.spirit_id,
+    Event.occurred_at.desc(),
+    Event.created_at.desc(),
+    Event.id.desc(),
+    postgresql_include=["event_type", "session_id", "importance_score"],
+    postgresql_where=text("is_deleted = false"),
+)
+
+
+# JSONB containment (meta @> '{...}') on live events; jsonb_path_ops is smaller/faster than the default ops
+Index(
+    "ix_events_meta_gin",
+    Event.meta,
+    postgresql_using="gin",
+    postgresql_ops={"meta": "jsonb_path_ops"},
+    postgresql_where=text("is_deleted = false"),
+)
 
 
 class EventCreate(EventBase):
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel, Relationship
 
@@ -42,7 +42,7 @@ class Memory(MemoryBase, TimestampMixin, table=True):
     is_deleted: bool = Field(default=False, description="Soft delete flag (provenance preservation)")
 
     # Relationship to Spirit
-    spirit: Spirit = Relationship(back_populates="memories")
+    spirit: Spirit = Relationship(back_populates="memories", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
 class MemoryCreate(MemoryBase):
@@ -69,3 +69,22 @@ class MemoryUpdate(SQLModel):
     time_end: datetime | None = None
     meta: dict[str, Any] | None = None
     is_deleted: bool | None = None
+
+
+# Per-spirit recency-ordered scans of live memories (recall/curation), already in order: no heap sort
+Index(
+    "ix_memories_spirit_time",
+    Memory.spirit_id,
+    Memory.time_end.desc().nulls_last(),
+    Memory.created_at.desc(),
+    postgresql_where=text("is_deleted = false"),
+)
+
+# meta @> containment on live memories (see ix_events_meta_gin)
+Index(
+    "ix_memories_meta_gin",
+    Memory.meta,
+    postgresql_using="gin",
+    postgresql_ops={"meta": "jsonb_path_ops"},
+    postgresql_where=text("is_deleted = false"),
+)
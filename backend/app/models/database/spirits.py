@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel, Relationship
 
@@ -23,11 +23,60 @@ class Spirit(SpiritBase, TimestampMixin, table=True):
     __tablename__ = "spirits"
 
     id: UUID = Field(default=None, primary_key=True, sa_column_kwargs={"server_default": text("gen_random_uuid()")})
-    is_deleted: bool = Field(default=False)
+    deleted_at: datetime | None = Field(
+        default=None,
+        nullable=True,
+        sa_type=DateTime(timezone=True),
+        description="When the spirit was soft-deleted (NULL = live)"
+    )
 
-    # Relationships
-    events: list["Event"] = Relationship(back_populates="spirit")
-    memories: list["Memory"] = Relationship(back_populates="spirit")
+    # Relationships (raise_on_sql: never lazy-load; opt into loading per query)
+    events: list["Event"] = Relationship(back_populates="spirit", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    memories: list["Memory"] = Relationship(back_populates="spirit", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+
+# Keyset pagination for get_all: (created_at, id) DESC range seeks over live spirits
+Index(
+    "ix_spirits_created_id",
+    Spirit.created_at.desc(),
+    Spirit.id.desc(),
+    postgresql_where=text("deleted_at IS NULL"),
+)
+
+# Trigram index: lets `name ILIKE '%q%'` (search_by_name) use an index instead of a seq scan
+Index(
+    "ix_spirits_name_trgm",
+    Spirit.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+    postgresql_where=text("deleted_at IS NULL"),
+)
+
+
+# Prefix search (search_by_name match=prefix): lower(name) LIKE 'q%' as a btree range scan
+Index(
+    "ix_spirits_name_lower_prefix",
+    func.lower(Spirit.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+    postgresql_where=text("deleted_at IS NULL"),
+)
+
+# meta @> containment on live spirits (see ix_events_meta_gin)
+Index(
+    "ix_spirits_meta_gin",
+    Spirit.meta,
+    postgresql_using="gin",
+    postgresql_ops={"meta": "jsonb_path_ops"},
+    postgresql_where=text("deleted_at IS NULL"),
+)
+
+
+# Recently-deleted listing (get_recently_deleted): only soft-deleted rows, newest deletion first
+Index(
+    "ix_spirits_deleted",
+    Spirit.deleted_at.desc(),
+    postgresql_where=text("deleted_at IS NOT NULL"),
+)
 
 
 class SpiritCreate(SpiritBase):
@@ -40,6 +89,7 @@ class SpiritRead(SpiritBase):
     id: UUID
     created_at: datetime
     updated_at: datetime
+    deleted_at: datetime | None = None
 
 
 class SpiritUpdate(SQLModel):
@@ -47,4 +97,4 @@ class SpiritUpdate(SQLModel):
     name: str | None = None
     description: str | None = None
     meta: dict[str, Any] | None = None
-    is_deleted: bool | None = None
+    is_deleted: bool | None = None  # Not a column: True sets deleted_at (soft delete), False clears it (restore)
@@ -0,0 +1,9 @@
+"""Composite Spirit DTOs (read models spanning more than one table)."""
+
+from backend.app.models.database.events import EventRead
+from backend.app.models.database.spirits import SpiritRead
+
+
+class SpiritWithEventsRead(SpiritRead):
+    """Spirit plus its most recent events (newest first)."""
+    events: list[EventRead] = []
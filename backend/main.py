@@ -1,13 +1,33 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.app.api.router import api_router
-from backend.app.core.config import settings
+from backend.app.core.config import get_settings
+from backend.app.core.database import engine, warm_pool
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the DB connection pool on startup; close pooled connections on shutdown."""
+    if settings.DB_POOL_WARM:
+        await warm_pool()
+    yield
+    await engine.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_PREFIX}/openapi.json"
+    openapi_url=f"{settings.API_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,  # Rust encoder, native UUID/datetime support
+    lifespan=lifespan,
 )
 
 # Set up CORS
@@ -17,26 +37,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count"],  # Readable by browser clients (caching, pagination)
 )
 
-# Include API router
-app.include_router(api_router, prefix=settings.API_PREFIX)
+# Compress JSON bodies (list pages, streams); tiny responses aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Include API router (prefix applied by api_router itself)
+app.include_router(api_router)
+
+
+# Static bodies, encoded once at import. A fresh Response per request: middleware mutates headers.
+_ROOT_BODY = orjson.dumps({
+    "message": "Elephantasm LTAM API",
+    "version": settings.VERSION,
+    "docs": "/docs"
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
 
-@app.get("/")
-async def root():
+@app.get("/", include_in_schema=False)
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "message": "Elephantasm LTAM API",
-        "version": settings.VERSION,
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+@app.get("/health", include_in_schema=False)
+async def health() -> Response:
+    """Health check endpoint (load balancer probe; documented API health lives under API_PREFIX)."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 # Import settings
-from backend.app.core.config import settings
+from backend.app.core.config import get_settings
 
 # Import all models for autogenerate
 from backend.app.models.database.spirits import Spirit
@@ -22,6 +22,8 @@ from backend.app.models.database.mixins.timestamp import TimestampMixin
 # Import SQLModel's metadata
 from sqlmodel import SQLModel
 
+settings = get_settings()
+
 # Alembic Config object
 config = context.config
 
@@ -0,0 +1,34 @@
+"""add events spirit active covering index
+
+Revision ID: 3b7c2d9e4f10
+Revises: ea8543bfd9f8
+Create Date: 2025-10-19 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7c2d9e4f10'
+down_revision: Union[str, None] = 'ea8543bfd9f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial covering index: per-spirit live-event listing/counting without heap fetches
+    op.create_index(
+        'ix_events_spirit_active',
+        'events',
+        ['spirit_id', sa.text('occurred_at DESC')],
+        unique=False,
+        postgresql_include=['event_type', 'session_id', 'importance_score'],
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_spirit_active', table_name='events')
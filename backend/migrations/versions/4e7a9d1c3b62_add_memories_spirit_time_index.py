@@ -0,0 +1,41 @@
+"""add memories spirit time index
+
+Revision ID: 4e7a9d1c3b62
+Revises: 9c3f6a2e1b57
+Create Date: 2025-10-21 14:18:52.271930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7a9d1c3b62'
+down_revision: Union[str, None] = '9c3f6a2e1b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Supersedes ix_memories_spirit_active: live memories per spirit, most recent time_end first
+    op.drop_index('ix_memories_spirit_active', table_name='memories')
+    op.create_index(
+        'ix_memories_spirit_time',
+        'memories',
+        ['spirit_id', sa.text('time_end DESC NULLS LAST'), sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_memories_spirit_time', table_name='memories')
+    op.create_index(
+        'ix_memories_spirit_active',
+        'memories',
+        ['spirit_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
@@ -0,0 +1,44 @@
+"""extend events spirit active index for keyset pagination
+
+Revision ID: 5a0d3e8b6c12
+Revises: c4e9f1a27b85
+Create Date: 2025-10-19 16:21:54.602317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a0d3e8b6c12'
+down_revision: Union[str, None] = 'c4e9f1a27b85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Key columns now mirror get_recent's ORDER BY (occurred_at, created_at, id) DESC,
+    # so keyset pages are one index range scan with no sort step
+    op.drop_index('ix_events_spirit_active', table_name='events')
+    op.create_index(
+        'ix_events_spirit_active',
+        'events',
+        ['spirit_id', sa.text('occurred_at DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['event_type', 'session_id', 'importance_score'],
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_spirit_active', table_name='events')
+    op.create_index(
+        'ix_events_spirit_active',
+        'events',
+        ['spirit_id', sa.text('occurred_at DESC')],
+        unique=False,
+        postgresql_include=['event_type', 'session_id', 'importance_score'],
+        postgresql_where=sa.text('is_deleted = false'),
+    )
@@ -0,0 +1,111 @@
+"""recompute server-generated dedupe keys
+
+Revision ID: 7b2e5c9a1d48
+Revises: f1c6b8a94d23
+Create Date: 2025-10-23 09:12:45.560318
+
+"""
+import calendar
+import hashlib
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e5c9a1d48'
+down_revision: Union[str, None] = 'f1c6b8a94d23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+
+# The key schemes are frozen here rather than imported from EventOperations: this migration
+# must keep producing the same keys after the application code moves on.
+
+
+def _legacy_parts(row, occurred_at_str: str) -> list:
+    return [str(row.spirit_id), row.event_type, row.content[:100], occurred_at_str, row.source_uri]
+
+
+def _legacy_keys(row) -> set:
+    """Keys the earlier string-joined schemes (SHA-256 prefix, then BLAKE2b) produced for this row.
+
+    The old schemes hashed occurred_at.isoformat() of the value as received, so both the
+    UTC-aware form and the naive form (naive input stored as UTC) are candidates.
+    """
+    occurred_at = row.occurred_at.astimezone(timezone.utc)
+    keys = set()
+    for stamp in (occurred_at.isoformat(), occurred_at.replace(tzinfo=None).isoformat()):
+        parts = _legacy_parts(row, stamp)
+        keys.add(hashlib.sha256("|".join(parts).encode()).hexdigest()[:32])
+        keys.add(hashlib.blake2b(b"|".join(p.encode() for p in parts), digest_size=16).hexdigest())
+    return keys
+
+
+def _current_key(row) -> str:
+    """Current scheme (EventOperations._generate_dedupe_key): BLAKE2b over raw bytes, NUL-separated."""
+    occurred_at: datetime = row.occurred_at
+    h = hashlib.blake2b(digest_size=16)
+    h.update(row.spirit_id.bytes)
+    epoch_us = calendar.timegm(occurred_at.utctimetuple()) * 1_000_000 + occurred_at.microsecond
+    h.update(epoch_us.to_bytes(8, "big", signed=True))
+    for part in (row.event_type, row.content[:100], row.source_uri):
+        h.update(part.encode())
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _rewrite_keys(new_key_for) -> None:
+    """Rewrite dedupe_key on server-generated rows to new_key_for(row).
+
+    Only rows whose stored key matches a key the server would have generated from their own
+    columns are touched; client-supplied keys never match and are left as-is. If the target
+    key is already held by another row (the same event re-ingested under the other scheme),
+    that row keeps it and this one's key is NULLed, as the unique index allows.
+    """
+    conn = op.get_bind()
+    result = conn.execution_options(stream_results=True).execute(sa.text(
+        """
+        SELECT id, spirit_id, event_type, content, occurred_at, source_uri, dedupe_key
+        FROM events
+        WHERE source_uri IS NOT NULL AND dedupe_key IS NOT NULL
+        ORDER BY created_at, id
+        """
+    ))
+    update = sa.text(
+        """
+        UPDATE events
+        SET dedupe_key = CASE
+            WHEN EXISTS (SELECT 1 FROM events WHERE dedupe_key = :new_key) THEN NULL
+            ELSE :new_key
+        END
+        WHERE id = :id
+        """
+    )
+    for rows in result.partitions(BATCH_SIZE):
+        params = []
+        for row in rows:
+            new_key, old_keys = new_key_for(row)
+            if row.dedupe_key != new_key and row.dedupe_key in old_keys:
+                params.append({"id": row.id, "new_key": new_key})
+        if params:
+            conn.execute(update, params)
+
+
+def upgrade() -> None:
+    # Re-ingesting an event dedupes on the key computed by the current scheme; keys stored
+    # under the earlier schemes would never match it
+    _rewrite_keys(lambda row: (_current_key(row), _legacy_keys(row)))
+
+
+def downgrade() -> None:
+    # Back to the original SHA-256 prefix (UTC-aware isoformat, as for server-defaulted occurred_at)
+    def _to_legacy(row):
+        parts = _legacy_parts(row, row.occurred_at.astimezone(timezone.utc).isoformat())
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32], {_current_key(row)}
+
+    _rewrite_keys(_to_legacy)
@@ -0,0 +1,29 @@
+"""analyze spirits for count estimates
+
+Revision ID: 9c3f6a2e1b57
+Revises: e2a8c5d71f94
+Create Date: 2025-10-21 09:42:13.504821
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3f6a2e1b57'
+down_revision: Union[str, None] = 'e2a8c5d71f94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Refresh pg_class.reltuples (count_all_estimate) and planner stats for the new partial indexes.
+    # ANALYZE, not VACUUM ANALYZE: VACUUM can't run inside the migration transaction.
+    op.execute(sa.text('ANALYZE spirits'))
+
+
+def downgrade() -> None:
+    # Statistics refresh only; nothing to undo
+    pass
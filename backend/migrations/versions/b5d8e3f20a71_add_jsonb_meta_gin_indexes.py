@@ -0,0 +1,36 @@
+"""add jsonb meta gin indexes
+
+Revision ID: b5d8e3f20a71
+Revises: 4e7a9d1c3b62
+Create Date: 2025-10-22 10:07:29.661483
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8e3f20a71'
+down_revision: Union[str, None] = '4e7a9d1c3b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB containment (meta @> '{...}') on live rows; jsonb_path_ops only serves @>, but is compact
+    for table in ('events', 'memories', 'spirits'):
+        op.create_index(
+            f'ix_{table}_meta_gin',
+            table,
+            [sa.text('meta jsonb_path_ops')],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_where=sa.text('is_deleted = false'),
+        )
+
+
+def downgrade() -> None:
+    for table in ('spirits', 'memories', 'events'):
+        op.drop_index(f'ix_{table}_meta_gin', table_name=table)
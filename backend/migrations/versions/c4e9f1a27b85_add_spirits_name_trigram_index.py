@@ -0,0 +1,37 @@
+"""add spirits name trigram index
+
+Revision ID: c4e9f1a27b85
+Revises: 8f21a6c0d4b3
+Create Date: 2025-10-19 13:47:09.316274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9f1a27b85'
+down_revision: Union[str, None] = '8f21a6c0d4b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm ships with Supabase; gin_trgm_ops makes ILIKE '%q%' index-assisted
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_spirits_name_trgm',
+        'spirits',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_spirits_name_trgm', table_name='spirits')
+    # Extension left in place (may be used elsewhere in the database)
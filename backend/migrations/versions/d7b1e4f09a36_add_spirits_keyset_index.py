@@ -0,0 +1,33 @@
+"""add spirits keyset index
+
+Revision ID: d7b1e4f09a36
+Revises: 5a0d3e8b6c12
+Create Date: 2025-10-20 09:38:12.447901
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b1e4f09a36'
+down_revision: Union[str, None] = '5a0d3e8b6c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches get_all's ORDER BY (created_at, id) DESC over live spirits
+    op.create_index(
+        'ix_spirits_created_id',
+        'spirits',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_spirits_created_id', table_name='spirits')
@@ -0,0 +1,42 @@
+"""add partial indexes for live rows
+
+Revision ID: e2a8c5d71f94
+Revises: d7b1e4f09a36
+Create Date: 2025-10-20 11:05:37.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c5d71f94'
+down_revision: Union[str, None] = 'd7b1e4f09a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Prefix name search: lower(name) LIKE 'q%' as a btree range scan (locale-independent ops)
+    op.create_index(
+        'ix_spirits_name_lower_prefix',
+        'spirits',
+        [sa.text('lower(name) text_pattern_ops')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    # Per-spirit listing of live memories
+    op.create_index(
+        'ix_memories_spirit_active',
+        'memories',
+        ['spirit_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_memories_spirit_active', table_name='memories')
+    op.drop_index('ix_spirits_name_lower_prefix', table_name='spirits')
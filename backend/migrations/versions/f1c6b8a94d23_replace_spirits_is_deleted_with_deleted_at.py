@@ -0,0 +1,89 @@
+"""replace spirits is_deleted with deleted_at
+
+Revision ID: f1c6b8a94d23
+Revises: b5d8e3f20a71
+Create Date: 2025-10-22 16:31:04.118257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6b8a94d23'
+down_revision: Union[str, None] = 'b5d8e3f20a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_live_indexes(live_predicate: str) -> None:
+    """(Re)create the partial indexes over live spirits with the given WHERE clause."""
+    op.create_index(
+        'ix_spirits_created_id',
+        'spirits',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text(live_predicate),
+    )
+    op.create_index(
+        'ix_spirits_name_trgm',
+        'spirits',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        postgresql_where=sa.text(live_predicate),
+    )
+    op.create_index(
+        'ix_spirits_name_lower_prefix',
+        'spirits',
+        [sa.text('lower(name) text_pattern_ops')],
+        unique=False,
+        postgresql_where=sa.text(live_predicate),
+    )
+    op.create_index(
+        'ix_spirits_meta_gin',
+        'spirits',
+        [sa.text('meta jsonb_path_ops')],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_where=sa.text(live_predicate),
+    )
+
+
+def _drop_live_indexes() -> None:
+    for name in ('ix_spirits_meta_gin', 'ix_spirits_name_lower_prefix', 'ix_spirits_name_trgm', 'ix_spirits_created_id'):
+        op.drop_index(name, table_name='spirits')
+
+
+def upgrade() -> None:
+    op.add_column('spirits', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    # Deletion time was never recorded; the migration time is the best available approximation
+    op.execute(sa.text('UPDATE spirits SET deleted_at = now() WHERE is_deleted'))
+
+    # Partial indexes reference is_deleted in their predicate: rebuild them over deleted_at
+    _drop_live_indexes()
+    op.drop_column('spirits', 'is_deleted')
+    _create_live_indexes('deleted_at IS NULL')
+
+    # Recently-deleted listing
+    op.create_index(
+        'ix_spirits_deleted',
+        'spirits',
+        [sa.text('deleted_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_spirits_deleted', table_name='spirits')
+    op.add_column('spirits', sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.alter_column('spirits', 'is_deleted', server_default=None)
+    op.execute(sa.text('UPDATE spirits SET is_deleted = true WHERE deleted_at IS NOT NULL'))
+
+    _drop_live_indexes()
+    op.drop_column('spirits', 'deleted_at')
+    _create_live_indexes('is_deleted = false')
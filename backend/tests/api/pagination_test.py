@@ -0,0 +1,48 @@
+"""Tests for opaque keyset cursors."""
+
+import base64
+import json
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.api.pagination import decode_cursor, encode_cursor
+
+
+def _raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+def test_round_trip():
+    created_at = datetime(2025, 10, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+    cursor = encode_cursor(created_at, row_id)
+    assert decode_cursor(cursor, (datetime.fromisoformat, UUID)) == (created_at, row_id)
+
+
+def test_round_trip_name_with_separators():
+    row_id = uuid4()
+    cursor = encode_cursor("a|b,\"c\"", row_id)
+    assert decode_cursor(cursor, (str, UUID)) == ("a|b,\"c\"", row_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        _raw_cursor({"a": 1}),
+        _raw_cursor([str(uuid4())]),  # wrong arity
+        _raw_cursor(["x", str(uuid4()), "y"]),  # wrong arity
+        _raw_cursor([1, 2]),  # wrong element types
+        _raw_cursor(["name", {}]),
+        _raw_cursor(["name", None]),
+        _raw_cursor(["name", "not-a-uuid"]),
+    ],
+)
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, (str, UUID))
+    assert exc_info.value.status_code == 400
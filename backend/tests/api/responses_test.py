@@ -0,0 +1,176 @@
+"""Tests for shared response helpers (list encoding, streaming, ETags, conditional GET)."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Optional
+from uuid import uuid4
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from backend.app.api import responses
+from backend.app.api.responses import (
+    _dump_list,
+    conditional_get,
+    etag_matches,
+    make_etag,
+    stream_list_response,
+)
+from backend.app.models.database.spirits import SpiritRead
+
+
+NOW = datetime(2025, 10, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _spirit_row(name: str = "Ghost", meta: Optional[dict] = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(), name=name, description=None, meta=meta or {}, created_at=NOW, updated_at=NOW, deleted_at=None
+    )
+
+
+def test_dump_list_encodes_rows():
+    row = _spirit_row(meta={"k": "v"})
+    [encoded] = orjson.loads(_dump_list(SpiritRead, [row]))
+    assert encoded["id"] == str(row.id)
+    assert encoded["meta"] == {"k": "v"}
+    assert encoded["created_at"] == "2025-10-01T12:00:00Z"
+
+
+def test_dump_list_falls_back_for_ints_beyond_64_bits():
+    rows = [_spirit_row(), _spirit_row(meta={"n": 2**70})]
+    # stdlib json: orjson can't decode the oversized int either
+    decoded = json.loads(_dump_list(SpiritRead, rows))
+    assert [item["meta"] for item in decoded] == [{}, {"n": 2**70}]
+
+
+class _Session:
+    """Stands in for AsyncSessionLocal()'s session; records close()."""
+
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+async def _read_body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def test_stream_list_response_streams_batches_then_closes_session(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(responses, "AsyncSessionLocal", lambda: session)
+    rows = [_spirit_row(name="a"), _spirit_row(name="b"), _spirit_row(name="c")]
+
+    async def batches(db):
+        assert db is session
+        yield rows[:2]
+        yield rows[2:]
+
+    async def run():
+        response = await stream_list_response(batches, SpiritRead)
+        return await _read_body(response)
+
+    assert [item["name"] for item in orjson.loads(asyncio.run(run()))] == ["a", "b", "c"]
+    assert session.closed
+
+
+def test_stream_list_response_raises_before_the_200_is_sent(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(responses, "AsyncSessionLocal", lambda: session)
+
+    async def batches(db):
+        raise RuntimeError("query failed")
+        yield
+
+    # The first batch is fetched up front, so the error reaches the route (-> 5xx) instead of
+    # surfacing mid-body after a 200
+    with pytest.raises(RuntimeError):
+        asyncio.run(stream_list_response(batches, SpiritRead))
+    assert session.closed
+
+
+def test_stream_list_response_empty(monkeypatch):
+    monkeypatch.setattr(responses, "AsyncSessionLocal", _Session)
+
+    async def batches(db):
+        return
+        yield
+
+    async def run():
+        response = await stream_list_response(batches, SpiritRead)
+        return await _read_body(response)
+
+    assert asyncio.run(run()) == b"[]"
+
+
+def test_make_etag_is_weak_and_tracks_updated_at():
+    row_id = uuid4()
+    updated_at = datetime(2025, 10, 1, 12, 0, 0, 250000)
+    etag = make_etag(row_id, updated_at)
+    assert etag == f'W/"{row_id}-1759320000250000"'
+    assert make_etag(row_id, updated_at.replace(tzinfo=timezone.utc)) == etag
+    assert make_etag(row_id, updated_at + timedelta(microseconds=1)) != etag
+
+
+def test_etag_matches_weak_comparison():
+    etag = make_etag(uuid4(), datetime(2025, 10, 1))
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)  # Strong form of the same tag
+    assert not etag_matches('W/"other"', etag)
+
+
+def test_etag_matches_wildcard_and_lists():
+    etag = make_etag(uuid4(), datetime(2025, 10, 1))
+    assert etag_matches("*", etag)
+    assert etag_matches(f'W/"a", {etag} , "b"', etag)
+    assert not etag_matches('W/"a", "b"', etag)
+
+
+def test_etag_matches_without_header():
+    etag = make_etag(uuid4(), datetime(2025, 10, 1))
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+
+
+def test_conditional_get_without_header_skips_lookup():
+    async def get_updated_at():
+        raise AssertionError("no If-None-Match: updated_at must not be queried")
+
+    assert asyncio.run(conditional_get(None, uuid4(), get_updated_at, "Spirit")) is None
+
+
+def test_conditional_get_matching_etag_is_304():
+    row_id = uuid4()
+
+    async def get_updated_at():
+        return NOW
+
+    etag = make_etag(row_id, NOW)
+    response = asyncio.run(conditional_get(etag, row_id, get_updated_at, "Spirit"))
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_conditional_get_stale_etag_falls_through():
+    row_id = uuid4()
+
+    async def get_updated_at():
+        return NOW + timedelta(seconds=1)
+
+    stale = make_etag(row_id, NOW)
+    assert asyncio.run(conditional_get(stale, row_id, get_updated_at, "Spirit")) is None
+
+
+def test_conditional_get_missing_row_is_404():
+    row_id = uuid4()
+
+    async def get_updated_at():
+        return None
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(conditional_get("*", row_id, get_updated_at, "Event"))
+    assert exc.value.status_code == 404
+    assert exc.value.detail == f"Event {row_id} not found"
@@ -0,0 +1,89 @@
+"""Tests for EventOperations pure helpers (dedupe keys, bulk-insert rows)."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from backend.app.domain.event_operations import EventOperations
+from backend.app.models.database.events import EventCreate
+
+
+SPIRIT_ID = uuid4()
+OCCURRED_AT = datetime(2025, 10, 1, 12, 0, 0, 123456)
+
+
+def _key(
+    spirit_id: UUID = SPIRIT_ID,
+    event_type: str = "message.in",
+    content: str = "hello",
+    occurred_at: datetime = OCCURRED_AT,
+    source_uri: str = "chat://thread/1"
+) -> str:
+    return EventOperations._generate_dedupe_key(spirit_id, event_type, content, occurred_at, source_uri)
+
+
+def test_dedupe_key_is_stable():
+    assert _key() == _key()
+    assert len(_key()) == 32
+
+
+def test_dedupe_key_naive_equals_utc_aware():
+    assert _key(occurred_at=OCCURRED_AT) == _key(occurred_at=OCCURRED_AT.replace(tzinfo=timezone.utc))
+    # Same instant in another offset
+    plus_two = timezone(timedelta(hours=2))
+    assert _key(occurred_at=OCCURRED_AT) == _key(occurred_at=datetime(2025, 10, 1, 14, 0, 0, 123456, tzinfo=plus_two))
+
+
+def test_dedupe_key_changes_with_inputs():
+    base = _key()
+    assert _key(occurred_at=datetime(2025, 10, 1, 12, 0, 0, 123457)) != base
+    assert _key(spirit_id=uuid4()) != base
+    assert _key(source_uri="chat://thread/2") != base
+    # Field separator: shifting text between fields must not collide
+    assert _key(event_type="message.in", content="xhello") != _key(event_type="message.inx", content="hello")
+
+
+def test_dedupe_key_uses_first_100_chars_of_content():
+    assert _key(content="a" * 100 + "tail") == _key(content="a" * 100 + "other")
+
+
+def test_build_insert_rows_shares_default_occurred_at_across_batch():
+    given = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    rows = EventOperations._build_insert_rows([
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="a"),
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="b", occurred_at=given),
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="c"),
+    ])
+    assert rows[1]["occurred_at"] == given
+    assert rows[0]["occurred_at"] is rows[2]["occurred_at"]
+    assert rows[0]["occurred_at"].tzinfo is timezone.utc
+
+
+def test_build_insert_rows_generates_dedupe_key_only_for_sourced_events():
+    [sourced, unsourced] = EventOperations._build_insert_rows([
+        EventCreate(
+            spirit_id=SPIRIT_ID, event_type="message.in", content="hello",
+            occurred_at=OCCURRED_AT, source_uri="chat://thread/1"
+        ),
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="hello", occurred_at=OCCURRED_AT),
+    ])
+    assert sourced["dedupe_key"] == _key()
+    assert unsourced["dedupe_key"] is None
+
+
+def test_build_insert_rows_keeps_explicit_dedupe_key():
+    [row] = EventOperations._build_insert_rows([
+        EventCreate(
+            spirit_id=SPIRIT_ID, event_type="message.in", content="hello",
+            source_uri="chat://thread/1", dedupe_key="client-key-1"
+        ),
+    ])
+    assert row["dedupe_key"] == "client-key-1"
+
+
+def test_build_insert_rows_defaults_meta_to_empty_dict():
+    rows = EventOperations._build_insert_rows([
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="a"),
+        EventCreate.model_construct(spirit_id=SPIRIT_ID, event_type="message.in", content="b", meta=None),
+        EventCreate(spirit_id=SPIRIT_ID, event_type="message.in", content="c", meta={"k": "v"}),
+    ])
+    assert [row["meta"] for row in rows] == [{}, {}, {"k": "v"}]
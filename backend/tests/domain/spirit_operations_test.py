@@ -0,0 +1,27 @@
+"""Tests for SpiritOperations pure helpers."""
+
+from backend.app.domain.spirit_operations import SpiritOperations
+from backend.app.models.database.spirits import SpiritUpdate
+
+
+def test_update_values_only_include_set_fields():
+    assert SpiritOperations._update_values(SpiritUpdate(name="Ghost")) == {"name": "Ghost"}
+    assert SpiritOperations._update_values(SpiritUpdate()) == {}
+
+
+def test_update_values_soft_delete_sets_deleted_at():
+    values = SpiritOperations._update_values(SpiritUpdate(is_deleted=True, description="gone"))
+    assert "is_deleted" not in values
+    assert values["description"] == "gone"
+    # Keeps an existing deletion time: COALESCE(deleted_at, now())
+    sql = str(values["deleted_at"]).lower()
+    assert "coalesce" in sql and "deleted_at" in sql and "now()" in sql
+
+
+def test_update_values_restore_clears_deleted_at():
+    values = SpiritOperations._update_values(SpiritUpdate(is_deleted=False))
+    assert values == {"deleted_at": None}
+
+
+def test_update_values_explicit_null_is_deleted_is_ignored():
+    assert SpiritOperations._update_values(SpiritUpdate(is_deleted=None)) == {}